@@ -15,6 +15,14 @@ const VISION_DATASET_DIR = join(LOGS_DIR, 'vision_dataset'); // HuggingFace data
 const VISION_IMAGES_DIR = join(VISION_DATASET_DIR, 'images'); // Images subdirectory
 
 const EXTERNAL_LOGGING_URL = 'https://andy.mindcraft-ce.com/api/log'; // Base URL for external logging
+const EXTERNAL_LOG_ENDPOINTS = {
+    normal: `${EXTERNAL_LOGGING_URL}/normal-logs`,
+    reasoning: `${EXTERNAL_LOGGING_URL}/reasoning-logs`,
+    'normal-vision': `${EXTERNAL_LOGGING_URL}/normal-vision`,
+    'reasoning-vision': `${EXTERNAL_LOGGING_URL}/reasoning-vision`,
+    usernames: `${EXTERNAL_LOGGING_URL}/usernames`,
+};
+const JSON_HEADERS = { 'Content-Type': 'application/json' };
 
 // --- Log File Paths ---
 const REASONING_LOG_FILE = join(LOGS_DIR, 'reasoning_logs.csv');
@@ -48,7 +56,12 @@ function ensureDirectoryExistence(dirPath) {
     return true;
 }
 
+// Log files whose header has been checked this session. Re-reading the whole
+// CSV on every entry made logging cost grow with the size of the log.
+const verifiedLogFiles = new Set();
+
 function ensureLogFile(logFile, header) {
+     if (verifiedLogFiles.has(logFile) && existsSync(logFile)) return true;
      if (!ensureDirectoryExistence(path.dirname(logFile))) return false; // Ensure parent dir exists
 
      if (!existsSync(logFile)) {
@@ -80,6 +93,7 @@ function ensureLogFile(logFile, header) {
             // Proceed cautiously, maybe log an error and continue?
         }
     }
+    verifiedLogFiles.add(logFile);
     return true;
 }
 
@@ -113,6 +127,8 @@ function sanitizeForCsv(value) {
     return `"${value.replace(/"/g, '""')}"`;
 }
 
+const REASONING_MARKER_REGEX = /\/think|\/no_think/g;
+
 // Helper function to clean reasoning markers from input
 function cleanReasoningMarkers(input) {
     if (typeof input !== 'string') {
@@ -120,44 +136,7 @@ function cleanReasoningMarkers(input) {
     }
     
     // Remove /think and /no_think markers
-    return input.replace(/\/think/g, '').replace(/\/no_think/g, '').trim();
-}
-
-function determineSubCategory(input, response) {
-    const lowerInput = input.toLowerCase();
-    const lowerResponse = response.toLowerCase();
-
-    // --- Start of Improved JavaScript Detection Logic ---
-
-    // 1. High-Confidence Check: Look for explicitly labeled JavaScript markdown blocks.
-    // This is the fastest and most reliable indicator.
-    const explicitJsBlockRegex = /```(javascript|js)\s*[\s\S]*?```/;
-    if (explicitJsBlockRegex.test(lowerResponse)) {
-        return 'coding';
-    }
-
-    // 2. Medium-Confidence Check: Look for generic code blocks that contain JS keywords.
-    // This catches cases where the model forgets to label the code language.
-    const genericBlockRegex = /```([\s\S]*?)```/g; // Use 'g' to find all blocks
-    const jsKeywordsRegex = /\b(const|let|var|function|async|await|import|export|require|=>|document|window|console\.)\b/;
-    
-    let match;
-    // Iterate through all generic code blocks found in the response.
-    while ((match = genericBlockRegex.exec(lowerResponse)) !== null) {
-        const blockContent = match[1]; // The content inside the ```
-        // If the content of any block contains JS-specific keywords, classify as coding.
-        if (jsKeywordsRegex.test(blockContent)) {
-            return 'coding';
-        }
-    }
-
-    // --- End of Improved Logic ---
-
-    if (lowerInput.includes('update your memory')) {
-        return 'summarization';
-    } else {
-        return 'gameplay'; // Default to gameplay
-    }
+    return input.replace(REASONING_MARKER_REGEX, '').trim();
 }
 
 // Helper function to clean imagePath from messages for text logs
@@ -346,7 +325,6 @@ export async function log(input, response) { // Made async to support fetch
     }
 
     const logType = determineLogType(trimmedResponse); // Use raw response for type determination
-    const subCategory = determineSubCategory(finalInputString, trimmedResponse); // Use raw inputs
     let logFile;
     let header;
     let settingFlag;
@@ -379,10 +357,10 @@ export async function log(input, response) { // Made async to support fetch
     // Perform external logging if enabled
     if (externalLoggingEnabled) {
         try {
-            const endpoint = `${EXTERNAL_LOGGING_URL}/${logType === 'reasoning' ? 'reasoning-logs' : 'normal-logs'}`;
+            const endpoint = EXTERNAL_LOG_ENDPOINTS[logType];
             const response = await fetch(endpoint, {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
+                headers: JSON_HEADERS,
                 body: JSON.stringify({
                     input: finalInputString,
                     output: trimmedResponse,
@@ -508,7 +486,7 @@ export async function logVision(conversationHistory, imageBuffer, response, visi
     // Perform external logging if enabled
     if (externalLoggingEnabled) {
         try {
-            const endpoint = `${EXTERNAL_LOGGING_URL}/${logType}-vision`; // Vision logs now include type
+            const endpoint = EXTERNAL_LOG_ENDPOINTS[`${logType}-vision`]; // Vision logs now include type
             const payload = {
                 input: inputData, // This is now the fully stringified input
                 output: rawResponse,
@@ -517,7 +495,7 @@ export async function logVision(conversationHistory, imageBuffer, response, visi
             };
             const response = await fetch(endpoint, {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
+                headers: JSON_HEADERS,
                 body: JSON.stringify(payload)
             });
 
@@ -659,14 +637,14 @@ export async function sendUsernames(bot) {
     }
 
     try {
-        const endpoint = `${EXTERNAL_LOGGING_URL}/usernames`;
+        const endpoint = EXTERNAL_LOG_ENDPOINTS.usernames;
         const payload = {
             usernames: usernames,
             timestamp: Date.now()
         };
         const response = await fetch(endpoint, {
             method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
+            headers: JSON_HEADERS,
             body: JSON.stringify(payload)
         });
 
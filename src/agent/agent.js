@@ -73,6 +73,9 @@ const INTERNAL_LOG_MESSAGES = [
   '.',   // 추가: 마침표 하나만 있는 응답
 ];
 
+// Unchanged status is still resent this often so the mind server sees a heartbeat
+const STATUS_HEARTBEAT_MS = 60000;
+
 export class Agent {
   constructor() {
     this.runtime_mode = 'minecraft';
@@ -85,6 +88,9 @@ export class Agent {
     // ✅ 명령 디바운스(중복 실행 방지)
     this._cmdDebounce = Object.create(null);
     this.executive = createExecutiveState();
+    // Last status payload sent to the mind server; cleared on reconnect
+    this.lastStatusKey = null;
+    this.lastStatusSentAt = 0;
   }
 
   _syncExecutiveAmbientState() {
@@ -640,7 +646,7 @@ export class Agent {
     this._idleTriggered = false;
   }
 
-  sendStatusUpdate() {
+  sendStatusUpdate(force = false) {
     if (serverProxy.getSocket() && this.bot) {
       const statusData = {
         health: this.bot.health || 20,
@@ -654,6 +660,13 @@ export class Agent {
           dimension: this.bot.game?.dimension || 'overworld'
         }
       };
+      // Periodic updates skip unchanged status but still resend as a heartbeat;
+      // explicit requests (force) always get a reply.
+      const statusKey = JSON.stringify(statusData);
+      const now = Date.now();
+      if (!force && statusKey === this.lastStatusKey && now - this.lastStatusSentAt < STATUS_HEARTBEAT_MS) return;
+      this.lastStatusKey = statusKey;
+      this.lastStatusSentAt = now;
       serverProxy.getSocket().emit('agent-status-update', this.name, statusData);
     }
   }
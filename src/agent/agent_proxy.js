@@ -23,6 +23,8 @@ class AgentServerProxy {
 
         this.socket.on('connect', () => {
             console.log('Connected to MindServer');
+            // A restarted server has no status for us; don't suppress the next update
+            if (this.agent) this.agent.lastStatusKey = null;
         });
 
         this.socket.on('disconnect', () => {
@@ -53,7 +55,7 @@ class AgentServerProxy {
 
 		this.socket.on('request-status', () => {
 			if (this.agent && this.agent.sendStatusUpdate) {
-				this.agent.sendStatusUpdate();
+				this.agent.sendStatusUpdate(true);
 			}
 		});
     }
@@ -1,6 +1,12 @@
 import { strictFormat } from '../utils/text.js';
 import { log, logVision } from '../../logger.js';
 
+const MAX_RETRIES = 3;
+const RETRY_BASE_DELAY_MS = 250;
+const MAX_RETRY_AFTER_MS = 10000;
+const RETRY_STATUSES = new Set([429, 502, 503, 504]);
+const EMBEDDING_CACHE_SIZE = 256;
+
 export class Local {
     constructor(model_name, url, params) {
         this.model_name = model_name;
@@ -8,6 +14,12 @@ export class Local {
         this.url = url || 'http://127.0.0.1:11434';
         this.chat_endpoint = '/api/chat';
         this.embedding_endpoint = '/api/embeddings';
+        this.chat_url = new URL(this.chat_endpoint, this.url);
+        this.embedding_url = new URL(this.embedding_endpoint, this.url);
+        this.embedding_cache = new Map(); // text -> embedding, least recently used first
+        // Static request headers, built once. Node's fetch keeps connections to
+        // the Ollama host alive in a shared pool, so only the body varies per call.
+        this.headers = { 'Content-Type': 'application/json' };
         // Note: Actual multimodal support depends on the specific Ollama model (e.g., LLaVA, BakLLaVA)
         this.supportsRawImageInput = true;
     }
@@ -48,7 +60,7 @@ export class Local {
             console.log(`Awaiting local response... (model: ${model}, attempt: ${attempt})`);
             let res = null;
             try {
-                let apiResponse = await this.send(this.chat_endpoint, {
+                let apiResponse = await this.send(this.chat_url, {
                     model: model,
                     messages: messages,
                     stream: false,
@@ -113,28 +125,59 @@ export class Local {
     }
 
     async embed(text) {
+        // Embeddings are deterministic per model. The same conversation text is
+        // embedded again when promptConvo retries, and when promptCoding reuses it.
+        let cached = this.embedding_cache.get(text);
+        if (cached) {
+            this.embedding_cache.delete(text);
+            this.embedding_cache.set(text, cached);
+            return cached;
+        }
         let model = this.model_name || 'nomic-embed-text';
         let body = { model: model, input: text };
-        let res = await this.send(this.embedding_endpoint, body);
-        return res['embedding'];
+        let res = await this.send(this.embedding_url, body);
+        let embedding = res['embedding'];
+        this.embedding_cache.set(text, embedding);
+        if (this.embedding_cache.size > EMBEDDING_CACHE_SIZE)
+            this.embedding_cache.delete(this.embedding_cache.keys().next().value);
+        return embedding;
     }
 
-    async send(endpoint, body) {
-        const url = new URL(endpoint, this.url);
-        let method = 'POST';
-        let headers = new Headers();
-        const request = new Request(url, { method, headers, body: JSON.stringify(body) });
+    async send(url, body) {
+        const payload = JSON.stringify(body);
         let data = null;
-        try {
-            const res = await fetch(request);
-            if (res.ok) {
-                data = await res.json();
-            } else {
+        for (let attempt = 0; attempt <= MAX_RETRIES; attempt++) {
+            let retryable = false;
+            let retryAfterMs = null;
+            try {
+                const res = await fetch(url, {
+                    method: 'POST',
+                    headers: this.headers,
+                    body: payload
+                });
+                if (res.ok) {
+                    data = await res.json();
+                    break;
+                }
+                retryable = RETRY_STATUSES.has(res.status);
+                const retryAfter = Number(res.headers.get('retry-after'));
+                if (retryable && retryAfter > 0)
+                    retryAfterMs = Math.min(retryAfter * 1000, MAX_RETRY_AFTER_MS);
+                // Release the socket back to the keep-alive pool before retrying
+                await res.body?.cancel();
                 throw new Error(`Ollama Status: ${res.status}`);
+            } catch (err) {
+                // Network-level failures (Ollama restarting, socket reset) surface as TypeError.
+                retryable = retryable || err instanceof TypeError;
+                if (!retryable || attempt === MAX_RETRIES) {
+                    console.error('Failed to send Ollama request.');
+                    console.error(err);
+                    break;
+                }
             }
-        } catch (err) {
-            console.error('Failed to send Ollama request.');
-            console.error(err);
+            // Honour the server's Retry-After, else exponential backoff with full jitter
+            const delay = retryAfterMs ?? Math.random() * RETRY_BASE_DELAY_MS * 2 ** attempt;
+            await new Promise(resolve => setTimeout(resolve, delay));
         }
         return data;
     }
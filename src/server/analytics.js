@@ -153,11 +153,13 @@ export class AnalyticsManager {
             id: this.generateMessageId()
         };
         
-        this.messageHistory[agentName].push(message);
+        const history = this.messageHistory[agentName];
+        history.push(message);
         
-        // Keep only last 1000 messages per agent
-        if (this.messageHistory[agentName].length > 1000) {
-            this.messageHistory[agentName] = this.messageHistory[agentName].slice(-1000);
+        // Keep only last 1000 messages per agent. Trimming in place avoids
+        // allocating a new array per message; the shift itself is still O(n)
+        if (history.length > 1000) {
+            history.splice(0, history.length - 1000);
         }
         
         // Update analytics
@@ -220,20 +222,25 @@ export class AnalyticsManager {
         }
     }
     
+    updatePeakConcurrentAgents(activeAgents = []) {
+        if (activeAgents.length > this.systemMetrics.peakConcurrentAgents) {
+            this.systemMetrics.peakConcurrentAgents = activeAgents.length;
+        }
+    }
+    
     getAnalyticsSummary(activeAgents = []) {
+        const online = new Set(activeAgents);
         const agents = Object.keys(this.agentAnalytics).map(name => ({
             name,
             ...this.agentAnalytics[name],
-            isOnline: activeAgents.includes(name)
+            isOnline: online.has(name)
         }));
         
         const totalMessages = Object.values(this.messageHistory)
             .reduce((sum, history) => sum + history.length, 0);
         
         const currentConcurrentAgents = activeAgents.length;
-        if (currentConcurrentAgents > this.systemMetrics.peakConcurrentAgents) {
-            this.systemMetrics.peakConcurrentAgents = currentConcurrentAgents;
-        }
+        this.updatePeakConcurrentAgents(activeAgents);
         
         return {
             agents,
@@ -340,11 +347,12 @@ export class AnalyticsManager {
                 timestamp: Date.now()
             };
             
-            fs.writeFileSync(filename, JSON.stringify(analyticsData, null, 2));
+            const serialized = JSON.stringify(analyticsData, null, 2);
+            fs.writeFileSync(filename, serialized);
             
             // Also save a backup with timestamp
             const backupFilename = path.join(this.analyticsDir, `backup_${Date.now()}.json`);
-            fs.writeFileSync(backupFilename, JSON.stringify(analyticsData, null, 2));
+            fs.writeFileSync(backupFilename, serialized);
             
             // Clean up old backups (keep only last 10)
             this.cleanupOldBackups();
@@ -126,7 +126,9 @@ class RobotService {
         lastErr = e;
         if (i < this.retries) {
           if (this.debug) console.log(`↻ ${label} retry ${i + 1}: ${e.message}`);
-          await new Promise(r => setTimeout(r, 200 * (i + 1)));
+          // Exponential backoff with jitter so retries from several agents don't line up
+          const base = 200 * 2 ** i;
+          await new Promise(r => setTimeout(r, base / 2 + Math.random() * base / 2));
         }
       }
     }
@@ -507,7 +509,12 @@ const agentManagers = {};
 const webClients = new Set();
 
 function broadcastAnalytics() {
-  const analyticsUpdate = analyticsManager.getAnalyticsSummary(Object.keys(inGameAgents));
+  const activeAgents = Object.keys(inGameAgents);
+  // Peak tracking feeds saved/exported analytics, so keep it even when headless
+  analyticsManager.updatePeakConcurrentAgents(activeAgents);
+  // Nobody is watching; skip building and emitting the summary.
+  if (webClients.size === 0) return;
+  const analyticsUpdate = analyticsManager.getAnalyticsSummary(activeAgents);
   webClients.forEach(client => {
     client.emit('analytics-update', analyticsUpdate);
   });
@@ -1116,6 +1123,12 @@ export function createMindServer(port = 8080) {
     console.log(`🤖 Robot REST API: http://localhost:${port}/robot/*`);
   });
 
+  // Persist analytics on shutdown instead of losing up to 5 minutes of data.
+  // Signals are turned into a normal exit so the 'exit' hook runs.
+  process.once('exit', () => analyticsManager.saveAnalytics());
+  process.once('SIGINT', () => process.exit(130));
+  process.once('SIGTERM', () => process.exit(143));
+
   return server;
 }
 
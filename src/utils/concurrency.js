@@ -0,0 +1,22 @@
+const DEFAULT_CONCURRENCY = 8;
+
+// Run fn over every item with at most `limit` calls in flight at once.
+// Rejects on the first error and starts no new items after it; calls already
+// in flight are left to finish.
+export async function forEachWithLimit(items, fn, limit = DEFAULT_CONCURRENCY) {
+    let next = 0;
+    let failed = false;
+    const worker = async () => {
+        while (!failed && next < items.length) {
+            const item = items[next++];
+            try {
+                await fn(item);
+            } catch (err) {
+                failed = true;
+                throw err;
+            }
+        }
+    };
+    const num_workers = Math.min(limit, items.length);
+    await Promise.all(Array.from({ length: num_workers }, worker));
+}
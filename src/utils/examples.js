@@ -1,5 +1,6 @@
 import { cosineSimilarity } from './math.js';
 import { stringifyTurns, wordOverlapScore } from './text.js';
+import { forEachWithLimit } from './concurrency.js';
 
 export class Examples {
     constructor(model, select_num=2) {
@@ -26,17 +27,12 @@ export class Examples {
             return;
 
         try {
-            // Create array of promises first
-            const embeddingPromises = examples.map(example => {
-                const turn_text = this.turnsToText(example);
-                return this.model.embed(turn_text)
-                    .then(embedding => {
-                        this.embeddings[turn_text] = embedding;
-                    });
+            // Embed with a fixed number of workers rather than one request per
+            // example at once, which floods local servers and trips API rate limits
+            const texts = examples.map(example => this.turnsToText(example));
+            await forEachWithLimit(texts, async (turn_text) => {
+                this.embeddings[turn_text] = await this.model.embed(turn_text);
             });
-            
-            // Wait for all embeddings to complete
-            await Promise.all(embeddingPromises);
         } catch (err) {
             console.warn('Error with embedding model, using word-overlap instead.');
             this.model = null;